@@ -1,52 +1,111 @@
+import array
+import copy
+import logging
 from typing import List, Optional, Dict, Tuple
 from game import Role, Action, RoleClaim, ActionResolution
 from ai_strategies import AIStrategy, BasicStrategy
 
+log = logging.getLogger("complots.ai")
+
+HISTORY_SIZE = 64  # Own actions kept in the ring buffer
+
 class AIPlayer:
-    def __init__(self, player_id: int, strategy: AIStrategy = None):
+    __slots__ = ('player_id', '_strategy', 'action_history', '_ah_idx', 'verbose',
+                 '_eval', '_challenge', '_counter', '_loss', '_discard', '_redo', '_blackmail', '_undertaker')
+
+    def __init__(self, player_id: int, strategy: AIStrategy = None, verbose: bool = False):
         self.player_id = player_id
         self.strategy = strategy or BasicStrategy()  # Default to BasicStrategy if none provided
-        self.action_history = []  # Track own actions
+        # Ring buffer of own Action ids, _ah_idx counts actions ever taken
+        self.action_history = array.array('b', [0] * HISTORY_SIZE)
+        self._ah_idx = 0
+        self.verbose = verbose  # Log decisions to "complots.ai"; keep off for simulations
+
+    @property
+    def strategy(self) -> AIStrategy:
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, strategy: AIStrategy) -> None:
+        """Swap the strategy; a Game already holding this player must call refresh_challengers()."""
+        self._strategy = strategy
+        # Bind strategy methods once so each decision skips the method lookup
+        self._eval = strategy.evaluate_action
+        self._challenge = strategy.should_challenge
+        self._counter = strategy.should_counter
+        self._loss = strategy.choose_card_to_lose
+        self._discard = strategy.choose_card_to_discard
+        self._redo = strategy.should_redo_spy
+        self._blackmail = strategy.should_pay_blackmail
+        self._undertaker = strategy.should_claim_undertaker_coins
         
-    def choose_action(self, valid_actions: List[Action], game_state) -> tuple[Action, Optional[int], Optional[Role]]:
-        action, target_id, claimed_role = self.strategy.evaluate_action(game_state, valid_actions, self.player_id)
-        self.action_history.append(action)
-        print(f"AI Player {self.player_id} chooses action: {action.value} " +
-              f"{'target: ' + str(target_id) if target_id else ''}")
+    def copy(self) -> "AIPlayer":
+        """Independent player for Game.clone rollouts: own action history and a deep copy of the strategy (rng included)."""
+        new = AIPlayer(self.player_id, copy.deepcopy(self._strategy), self.verbose)
+        new.action_history = array.array('b', self.action_history)
+        new._ah_idx = self._ah_idx
+        return new
+
+    def choose_action(self, valid_actions: List[Action], game_state,
+                      valid_mask: Optional[int] = None) -> tuple[Action, Optional[int], Optional[Role]]:
+        action, target_id, claimed_role = self._eval(game_state, valid_actions, self.player_id, valid_mask)
+        self.action_history[self._ah_idx % HISTORY_SIZE] = action.id
+        self._ah_idx += 1
+        if self.verbose:
+            log.info("AI Player %d chooses action: %s target=%s", self.player_id, action.value, target_id)
         return action, target_id, claimed_role
 
+    @property
+    def never_challenges(self) -> bool:
+        """Lets Game skip polling this player for challenges."""
+        return self._strategy.never_challenges
+
+    def recent_actions(self, n: int) -> List[int]:
+        """Ids of the last n own actions (at most HISTORY_SIZE), most recent first."""
+        n = min(n, self._ah_idx, HISTORY_SIZE)
+        return [self.action_history[(self._ah_idx - k - 1) % HISTORY_SIZE] for k in range(n)]
+
     def wants_to_challenge(self, claim: RoleClaim, game_state) -> bool:
-        should_challenge = self.strategy.should_challenge(claim, game_state, self.player_id)
-        if should_challenge:
-            print(f"AI Player {self.player_id} challenges Player {claim.player_id}'s {claim.role.value} claim")
+        if self._strategy.never_challenges:
+            return False
+        should_challenge = self._challenge(claim, game_state, self.player_id)
+        if should_challenge and self.verbose:
+            log.info("AI Player %d challenges Player %d's %s claim", self.player_id, claim.player_id, claim.role.value)
         return should_challenge
 
     def wants_to_counter(self, resolution: ActionResolution, possible_roles: List[Role], game_state) -> Optional[Role]:
-        counter_role = self.strategy.should_counter(resolution, possible_roles, game_state, self.player_id)
-        if counter_role:
-            print(f"AI Player {self.player_id} counters {resolution.action.value} with {counter_role.value}")
+        if self._strategy.never_counters:
+            return None
+        counter_role = self._counter(resolution, possible_roles, game_state, self.player_id)
+        if counter_role and self.verbose:
+            log.info("AI Player %d counters %s with %s", self.player_id, resolution.action.value, counter_role.value)
         return counter_role
 
-    def choose_card_to_lose(self, cards) -> int:
-        return self.strategy.choose_card_to_lose(cards, self.player_id)
+    def choose_card_to_lose(self, cards, revealed_mask: Optional[int] = None) -> int:
+        return self._loss(cards, self.player_id, revealed_mask)
 
     def choose_card_to_discard(self, cards) -> int:
-        return self.strategy.choose_card_to_discard(cards, self.player_id)
+        return self._discard(cards, self.player_id)
 
     def wants_to_redo_spy(self, game_state) -> bool:
-        decision = self.strategy.should_redo_spy(game_state, self.player_id)
-        if decision:
-            print(f"AI Player {self.player_id} redoes Spy action")
+        if self._strategy.never_redoes_spy:
+            return False
+        decision = self._redo(game_state, self.player_id)
+        if decision and self.verbose:
+            log.info("AI Player %d redoes Spy action", self.player_id)
         return decision
 
     def chooses_pay_blackmail(self, game_state) -> bool:
-        decision = self.strategy.should_pay_blackmail(game_state, self.player_id)
-        print(f"AI Player {self.player_id} blackmail response: "
-              f"{'pays 3 coins' if decision else 'loses a card'}")
+        decision = self._strategy.always_pays_blackmail or self._blackmail(game_state, self.player_id)
+        if self.verbose:
+            log.info("AI Player %d blackmail response: %s", self.player_id,
+                     'pays 3 coins' if decision else 'loses a card')
         return decision
 
     def wants_to_claim_undertaker_coins(self, available_coins: int, game_state) -> bool:
-        decision = self.strategy.should_claim_undertaker_coins(available_coins, game_state, self.player_id)
-        if decision:
-            print(f"AI Player {self.player_id} claims Undertaker for {available_coins} coins")
+        if self._strategy.never_claims_undertaker:
+            return False
+        decision = self._undertaker(available_coins, game_state, self.player_id)
+        if decision and self.verbose:
+            log.info("AI Player %d claims Undertaker for %d coins", self.player_id, available_coins)
         return decision
\ No newline at end of file
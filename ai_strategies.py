@@ -1,48 +1,131 @@
-from abc import ABC, abstractmethod
+import threading
 from typing import List, Tuple, Optional, Dict
-from game import Action, Role, RoleClaim, ActionResolution
-import random
-
-class AIStrategy(ABC):
-    @abstractmethod
-    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int) -> tuple[Action, Optional[int], Optional[Role]]:
-        """Choose and evaluate an action to perform."""
-        pass
+from game import Action, Role, RoleClaim, ActionResolution, ACTION_BY_ID, ACTION_ROLE_ID, ACTIONS_NEEDING_CLAIM, ACTIONS_NEEDING_TARGET, ROLE_BY_ID, CARD_REVEALED, id_mask, next_set_bit
+import numpy as np
+
+try:
+    import ai_strategies_fast as _fast
+except ImportError:  # Numba not installed, use the pure-Python path
+    _fast = None
+
+# Bound once so hot paths skip the enum attribute lookups
+_INCOME = Action.INCOME
+_COUP = Action.COUP
+_ILLU = Action.ILLUSIONIST
+_SPY = Action.SPY
+_POPE = Action.POPE
+_BLACK = Action.BLACKMAILER
+_INCOME_ID = _INCOME.id
+_COUP_ID = _COUP.id
+_UNDERTAKER_ID = Role.UNDERTAKER.id
+# Role claimed by each action, indexed by Action.id (None if none)
+_ACTION_TO_ROLE = tuple(ROLE_BY_ID[role_id] if role_id >= 0 else None for role_id in ACTION_ROLE_ID)
+
+_ACTION_IDS = np.arange(len(Action))
+_ACTION_ROLE_SHIFT = np.maximum(ACTION_ROLE_ID, 0).astype(np.int64)  # bit of the claimed role
+_ACTION_NO_ROLE = 1 - ((ACTIONS_NEEDING_CLAIM >> _ACTION_IDS) & 1)  # 1 for actions that claim no role
+
+# RandomHonestStrategy's base weight per action, indexed by Action.id
+WEIGHT_BASE = np.zeros(len(Action), dtype=np.float32)
+WEIGHT_BASE[_INCOME.id] = 1.0
+WEIGHT_BASE[Action.FOREIGN_AID.id] = 0.5
+WEIGHT_BASE[_COUP.id] = 2.0
+WEIGHT_BASE[_ILLU.id] = 3.0
+WEIGHT_BASE[_POPE.id] = 2.5
+WEIGHT_BASE[_BLACK.id] = 2.5
+WEIGHT_BASE[_SPY.id] = 2.0
+
+# Each AIStrategy skip flag and the decision method it stands in for
+_FLAG_METHODS = (
+    ('never_challenges', 'should_challenge'),
+    ('never_counters', 'should_counter'),
+    ('never_redoes_spy', 'should_redo_spy'),
+    ('always_pays_blackmail', 'should_pay_blackmail'),
+    ('never_claims_undertaker', 'should_claim_undertaker_coins'),
+)
+
+_thread_state = threading.local()
+
+def _thread_rng() -> np.random.Generator:
+    """Per-thread SFC64 generator for strategies without an injected rng."""
+    rng = getattr(_thread_state, 'rng', None)
+    if rng is None:
+        rng = _thread_state.rng = np.random.Generator(np.random.SFC64())
+    return rng
+
+def counter_role_kernel(role_bits: np.ndarray, player_id: int, possible_mask: int) -> Optional[Role]:
+    """Lowest-id role of `possible_mask` the player holds unrevealed, or None."""
+    common = int(role_bits[player_id]) & possible_mask
+    return ROLE_BY_ID[next_set_bit(common)] if common else None
+
+def _first_unrevealed(cards, revealed_mask: Optional[int]) -> int:
+    """Index of the first unrevealed card, or 0 if all are revealed."""
+    if revealed_mask is None:
+        revealed_mask = sum(1 << i for i, card in enumerate(cards) if card & CARD_REVEALED)
+    unrevealed = ~revealed_mask & ((1 << len(cards)) - 1)
+    return next_set_bit(unrevealed) if unrevealed else 0
+
+class AIStrategy:
+    """Interface of an AI decision policy; subclasses override every method.
+
+    A plain class rather than an ABC so per-call dispatch stays cheap.
+    The class flags below declare decisions a strategy never varies, so
+    callers can skip the call entirely. A subclass that overrides a
+    decision method without setting the matching flag in its own body
+    gets that flag reset to False, so the override is always called.
+    """
+    __slots__ = ()
+
+    never_challenges = False
+    never_counters = False
+    never_redoes_spy = False
+    always_pays_blackmail = False
+    never_claims_undertaker = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for flag, method in _FLAG_METHODS:
+            if method in cls.__dict__ and flag not in cls.__dict__:
+                setattr(cls, flag, False)
+
+    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int,
+                        valid_mask: Optional[int] = None) -> tuple[Action, Optional[int], Optional[Role]]:
+        """Choose and evaluate an action to perform.
+
+        valid_mask, when given, is valid_actions as a bitmask over Action.id.
+        """
+        raise NotImplementedError
     
-    @abstractmethod
     def should_challenge(self, claim: RoleClaim, game_state, player_id: int) -> bool:
         """Decide whether to challenge a claim."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def should_counter(self, resolution: ActionResolution, possible_roles: List[Role], game_state, player_id: int) -> Optional[Role]:
         """Decide whether to counter an action."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
-    def choose_card_to_lose(self, cards: List[Role], player_id: int) -> int:
-        """Choose which card to reveal when losing one."""
-        pass
+    def choose_card_to_lose(self, cards: List[int], player_id: int, revealed_mask: Optional[int] = None) -> int:
+        """Choose which card to reveal when losing one.
+
+        revealed_mask, when given, has bit i set iff cards[i] is revealed.
+        """
+        raise NotImplementedError
     
-    @abstractmethod
-    def choose_card_to_discard(self, cards: List[Role], player_id: int) -> int:
+    def choose_card_to_discard(self, cards: List[int], player_id: int) -> int:
         """Choose which card to discard for Spy action."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def should_redo_spy(self, game_state, player_id: int) -> bool:
         """Decide whether to pay to redo Spy action."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def should_pay_blackmail(self, game_state, player_id: int) -> bool:
         """Decide whether to pay when blackmailed."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def should_claim_undertaker_coins(self, available_coins: int, game_state, player_id: int) -> bool:
         """Decide whether to claim Undertaker for coins."""
-        pass
+        raise NotImplementedError
 
 class BasicStrategy(AIStrategy):
     """Basic strategy that:
@@ -52,28 +135,57 @@ class BasicStrategy(AIStrategy):
     4. Always pays blackmail
     5. Never claims Undertaker
     """
-    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int) -> tuple[Action, Optional[int], Optional[Role]]:
-        current_player = game_state.players[player_id]
-            
-        # Prefer coup if we can afford it
-        if current_player.coins >= 7 and Action.COUP in valid_actions:
-            target_id = self._choose_coup_target(game_state, player_id)
-            return Action.COUP, target_id, None
-            
-        # Take income otherwise
-        return Action.INCOME, None, None
-    
+    __slots__ = ()
+
+    never_challenges = True
+    never_counters = True
+    never_redoes_spy = True
+    always_pays_blackmail = True
+    never_claims_undertaker = True
+
+    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int,
+                        valid_mask: Optional[int] = None) -> tuple[Action, Optional[int], Optional[Role]]:
+        # Most turns end in Income, so settle that before anything else
+        if game_state.players[player_id].coins < 7:
+            return _INCOME, None, None
+        if valid_mask is None:
+            valid_mask = id_mask(valid_actions)
+        if not (valid_mask >> _COUP_ID) & 1:
+            return _INCOME, None, None
+        # Coup the richest opponent
+        return _COUP, game_state.richest_alive_opponent(player_id), None
+
+    def evaluate_action_batch(self, coins: np.ndarray, alive: np.ndarray, player_ids: np.ndarray,
+                              valid_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized evaluate_action over B independent game states.
+
+        coins is int32[B, N], alive uint8[B, N], player_ids int32[B] and
+        valid_mask uint32[B] (bitmask over Action.id). Returns Action ids and
+        target ids (-1 for none), both int32[B].
+        """
+        rows = np.arange(len(player_ids))
+        can_coup = (coins[rows, player_ids] >= 7) & (((valid_mask >> _COUP_ID) & 1) != 0)
+
+        alive_others = alive.copy()
+        alive_others[rows, player_ids] = 0
+        candidates = np.where(alive_others != 0, coins, -1)
+        targets = np.argmax(candidates, axis=1).astype(np.int32)
+        targets[(candidates[rows, targets] < 0) | ~can_coup] = -1
+
+        actions = np.where(can_coup, _COUP_ID, _INCOME_ID).astype(np.int32)
+        return actions, targets
+
     def should_challenge(self, claim: RoleClaim, game_state, player_id: int) -> bool:
         return False
     
     def should_counter(self, resolution: ActionResolution, possible_roles: List[Role], game_state, player_id: int) -> Optional[Role]:
         return None
     
-    def choose_card_to_lose(self, cards: List[Role], player_id: int) -> int:
+    def choose_card_to_lose(self, cards: List[int], player_id: int, revealed_mask: Optional[int] = None) -> int:
         # Choose first available card
-        return next((i for i, card in enumerate(cards) if not card.revealed), 0)
+        return _first_unrevealed(cards, revealed_mask)
     
-    def choose_card_to_discard(self, cards: List[Role], player_id: int) -> int:
+    def choose_card_to_discard(self, cards: List[int], player_id: int) -> int:
         return 0
     
     def should_redo_spy(self, game_state, player_id: int) -> bool:
@@ -84,15 +196,6 @@ class BasicStrategy(AIStrategy):
 
     def should_claim_undertaker_coins(self, available_coins: int, game_state, player_id: int) -> bool:
         return False
-        
-    def _choose_coup_target(self, game_state, player_id: int) -> Optional[int]:
-        max_coins = -1
-        target_id = None
-        for i, player in enumerate(game_state.players):
-            if i != player_id and player.is_alive() and player.coins > max_coins:
-                max_coins = player.coins
-                target_id = i
-        return target_id
 
 class RandomHonestStrategy(AIStrategy):
     """
@@ -102,69 +205,68 @@ class RandomHonestStrategy(AIStrategy):
     Never challenges.
     Uses weighted random selection for action choice.
     """
-    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int) -> tuple[Action, Optional[int], Optional[Role]]:
-        player = game_state.players[player_id]
-        role_map = {
-            Action.ILLUSIONIST: Role.ILLUSIONIST,
-            Action.SPY: Role.SPY,
-            Action.POPE: Role.POPE,
-            Action.BLACKMAILER: Role.BLACKMAILER
-        }
-        # Assign weights to actions
-        action_weights = []
-        for action in valid_actions:
-            weight = 0
-            if action == Action.INCOME:
-                weight = 1
-            elif action == Action.FOREIGN_AID:
-                weight = 0.5
-            elif action == Action.COUP:
-                weight = 2
-            elif action in role_map:
-                if any(card.role == role_map[action] and not card.revealed for card in player.cards):
-                    if action == Action.ILLUSIONIST:
-                        weight = 3
-                    elif action == Action.POPE:
-                        weight = 2.5
-                    elif action == Action.BLACKMAILER:
-                        weight = 2.5
-                    elif action == Action.SPY:
-                        weight = 2
-            action_weights.append((action, weight))
+    __slots__ = ('_base_weights', '_rng', '_bits_buf', '_owned_buf', '_weights_buf', '_cum_buf')
+
+    never_challenges = True
+    never_redoes_spy = True
+
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        # Inject a seeded generator for reproducible simulations
+        self._rng = rng
+        self._base_weights = WEIGHT_BASE.copy()
+        # Scratch buffers so the Python-path pick allocates nothing per call
+        self._bits_buf = np.empty(len(Action), dtype=np.int64)
+        self._owned_buf = np.empty(len(Action), dtype=np.int64)
+        self._weights_buf = np.empty(len(Action), dtype=np.float32)
+        self._cum_buf = np.empty(len(Action), dtype=np.float32)
+
+    def evaluate_action(self, game_state, valid_actions: List[Action], player_id: int,
+                        valid_mask: Optional[int] = None) -> tuple[Action, Optional[int], Optional[Role]]:
+        if valid_mask is None:
+            valid_mask = id_mask(valid_actions)
+        u = (self._rng or _thread_rng()).random()
+        if _fast is not None:
+            action_id, target_id = _fast.choose_action_honest(
+                game_state.coins, game_state.alive_mask, game_state.role_bits, self._base_weights,
+                valid_mask, u, player_id)
+            return (ACTION_BY_ID[action_id], (target_id if target_id >= 0 else None),
+                    _ACTION_TO_ROLE[action_id])
+
+        # Zero the weight of invalid actions and of role actions without the role
+        playable = np.right_shift(valid_mask, _ACTION_IDS, out=self._bits_buf)
+        owned = np.right_shift(int(game_state.role_bits[player_id]), _ACTION_ROLE_SHIFT, out=self._owned_buf)
+        np.bitwise_or(owned, _ACTION_NO_ROLE, out=owned)
+        np.bitwise_and(playable, owned, out=playable)
+        np.bitwise_and(playable, 1, out=playable)
+        weights = np.multiply(self._base_weights, playable, out=self._weights_buf, casting='unsafe')
 
         # Weighted random choice
-        actions, weights = zip(*action_weights)
-        chosen_action = random.choices(actions, weights=weights, k=1)[0]
+        cum_weights = np.cumsum(weights, out=self._cum_buf)
+        # Rounding can push the draw past the final bucket, so clip to the last weighted action
+        total = cum_weights[-1]
+        last = int(np.searchsorted(cum_weights, total, side='left'))  # Last index with non-zero weight
+        action_id = min(int(np.searchsorted(cum_weights, u * total, side='right')), last)
+        chosen_action = ACTION_BY_ID[action_id]
 
-        # Determine target and claimed role if needed
+        # Determine target if needed
         target_id = None
-        claimed_role = None
-        if chosen_action == Action.COUP or chosen_action == Action.BLACKMAILER:
+        if (ACTIONS_NEEDING_TARGET >> action_id) & 1:
             # Target: alive opponent with most coins
-            target_id = max(
-                (i for i, p in enumerate(game_state.players) if i != player_id and p.is_alive()),
-                key=lambda i: game_state.players[i].coins,
-                default=None
-            )
-        if chosen_action in role_map:
-            claimed_role = role_map[chosen_action]
+            target_id = game_state.richest_alive_opponent(player_id)
 
-        return chosen_action, target_id, claimed_role
+        return chosen_action, target_id, _ACTION_TO_ROLE[action_id]
 
     def should_challenge(self, claim: RoleClaim, game_state, player_id: int) -> bool:
         return False
 
     def should_counter(self, resolution: ActionResolution, possible_roles: List[Role], game_state, player_id: int) -> Optional[Role]:
-        player = game_state.players[player_id]
-        for role in possible_roles:
-            if any(card.role == role and not card.revealed for card in player.cards):
-                return role
-        return None
+        possible_mask = resolution.counter_role_mask or id_mask(possible_roles)
+        return counter_role_kernel(game_state.role_bits, player_id, possible_mask)
 
-    def choose_card_to_lose(self, cards: List[Role], player_id: int) -> int:
-        return next((i for i, card in enumerate(cards) if not card.revealed), 0)
+    def choose_card_to_lose(self, cards: List[int], player_id: int, revealed_mask: Optional[int] = None) -> int:
+        return _first_unrevealed(cards, revealed_mask)
 
-    def choose_card_to_discard(self, cards: List[Role], player_id: int) -> int:
+    def choose_card_to_discard(self, cards: List[int], player_id: int) -> int:
         return 0
 
     def should_redo_spy(self, game_state, player_id: int) -> bool:
@@ -176,4 +278,4 @@ class RandomHonestStrategy(AIStrategy):
 
     def should_claim_undertaker_coins(self, available_coins: int, game_state, player_id: int) -> bool:
         player = game_state.players[player_id]
-        return any(card.role == Role.UNDERTAKER and not card.revealed for card in player.cards)
+        return bool((player.role_bits >> _UNDERTAKER_ID) & 1)
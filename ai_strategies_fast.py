@@ -0,0 +1,105 @@
+"""Numba-compiled decision kernels and rollouts for the built-in AI strategies.
+
+Importing this module requires Numba; `ai_strategies` falls back to its
+pure-Python path when it is not installed. Valid actions are passed as a
+bitmask over `Action.id`, and a returned target of -1 means "no target".
+"""
+import numpy as np
+from numba import njit, prange
+
+from game import Action, ACTION_ROLE_ID
+
+INCOME_ID = Action.INCOME.id
+COUP_ID = Action.COUP.id
+BLACKMAILER_ID = Action.BLACKMAILER.id
+
+@njit(cache=True)
+def choose_coup_target(coins, alive_mask, player_id):
+    """Alive opponent with the most coins (lowest id on ties), or -1."""
+    target_id = -1
+    max_coins = -1
+    for i in range(coins.shape[0]):
+        if i != player_id and alive_mask[i] != 0 and coins[i] > max_coins:
+            max_coins = coins[i]
+            target_id = i
+    return target_id
+
+@njit(cache=True)
+def choose_action_basic(coins, alive_mask, valid_action_mask, player_id):
+    """BasicStrategy: coup the richest opponent at 7+ coins, otherwise income."""
+    if coins[player_id] >= 7 and (valid_action_mask >> COUP_ID) & 1:
+        return COUP_ID, choose_coup_target(coins, alive_mask, player_id)
+    return INCOME_ID, -1
+
+@njit(cache=True)
+def choose_action_honest(coins, alive_mask, role_bits, weights, valid_action_mask, u, player_id):
+    """RandomHonestStrategy: weighted pick among valid actions backed by an owned role.
+
+    `weights` is indexed by Action.id and `u` is a uniform draw in [0, 1).
+    """
+    num_actions = weights.shape[0]
+    cum_weights = np.zeros(num_actions, dtype=np.float64)
+    total = 0.0
+    last = 0
+    owned = role_bits[player_id]
+    for a in range(num_actions):
+        if (valid_action_mask >> a) & 1:
+            role_id = ACTION_ROLE_ID[a]
+            if role_id < 0 or (owned >> role_id) & 1:
+                weight = weights[a]
+                if weight > 0:
+                    total += weight
+                    last = a
+        cum_weights[a] = total
+    # Rounding can push the draw past the final bucket, so clip to the last weighted action
+    action_id = min(np.searchsorted(cum_weights, u * total, side='right'), last)
+    target_id = -1
+    if action_id == COUP_ID or action_id == BLACKMAILER_ID:
+        target_id = choose_coup_target(coins, alive_mask, player_id)
+    return action_id, target_id
+
+@njit(nogil=True, cache=True)
+def rollout_basic(coins, cards_left, first_player, max_turns):
+    """Play a game to the end with BasicStrategy in every seat.
+
+    coins and cards_left (unrevealed cards per player) are copied, not
+    modified. Returns the winner's id, or -1 if max_turns is reached first.
+    """
+    coins = coins.copy()
+    cards_left = cards_left.copy()
+    num_players = coins.shape[0]
+    alive_count = 0
+    for i in range(num_players):
+        if cards_left[i] > 0:
+            alive_count += 1
+
+    player_id = first_player
+    for _ in range(max_turns):
+        if alive_count <= 1:
+            break
+        if coins[player_id] >= 7:
+            target_id = choose_coup_target(coins, cards_left, player_id)
+            coins[player_id] -= 7
+            cards_left[target_id] -= 1
+            if cards_left[target_id] == 0:
+                alive_count -= 1
+        else:
+            coins[player_id] += 1
+        player_id = (player_id + 1) % num_players
+        while cards_left[player_id] == 0:
+            player_id = (player_id + 1) % num_players
+
+    if alive_count != 1:
+        return -1
+    for i in range(num_players):
+        if cards_left[i] > 0:
+            return i
+    return -1
+
+@njit(parallel=True, cache=True)
+def rollout_basic_batch(coins, cards_left, first_player, max_turns):
+    """rollout_basic over B states in parallel: int32[B, N] coins, uint8[B, N] cards_left, int32[B] first_player."""
+    winners = np.empty(coins.shape[0], dtype=np.int32)
+    for b in prange(coins.shape[0]):
+        winners[b] = rollout_basic(coins[b], cards_left[b], first_player[b], max_turns)
+    return winners
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from game import Role, Action, RoleClaim, ActionResolution
+from game import Role, Action, RoleClaim, ActionResolution, ROLE_BY_ID, ACTION_ROLE_ID, ACTIONS_NEEDING_TARGET, ACTIONS_NEEDING_CLAIM, CARD_REVEALED, card_role
 
 class CLIPlayer:
     def __init__(self, player_id: int):
@@ -20,7 +20,7 @@ class CLIPlayer:
                     claimed_role = None
 
                     # Get target if needed
-                    if action in [Action.BLACKMAILER, Action.COUP]:
+                    if (ACTIONS_NEEDING_TARGET >> action.id) & 1:
                         print("\nChoose target player:")
                         for i, player in enumerate(game_state.players):
                             if i != self.player_id and player.is_alive():
@@ -28,8 +28,8 @@ class CLIPlayer:
                         target_id = int(input("Enter target player number: "))
 
                     # Get claimed role if needed
-                    if action in [Action.ILLUSIONIST, Action.SPY, Action.POPE, Action.BLACKMAILER]:
-                        claimed_role = Role[action.name]
+                    if (ACTIONS_NEEDING_CLAIM >> action.id) & 1:
+                        claimed_role = ROLE_BY_ID[ACTION_ROLE_ID[action.id]]
 
                     return action, target_id, claimed_role
             except (ValueError, IndexError):
@@ -59,7 +59,7 @@ class CLIPlayer:
         """Ask player which card they want to discard."""
         print("\nYour cards:")
         for i, card in enumerate(cards):
-            print(f"{i}: {card.role.value}")
+            print(f"{i}: {card_role(card).value}")
         while True:
             try:
                 choice = int(input("Choose card to discard: "))
@@ -95,8 +95,8 @@ class CLIPlayer:
         
         for i, player in enumerate(game_state.players):
             # Count alive and dead cards
-            alive_cards = [card.role.value for card in player.cards if not card.revealed]
-            dead_cards = [f"{card.role.value}(revealed)" for card in player.cards if card.revealed]
+            alive_cards = [card_role(card).value for card in player.cards if card < CARD_REVEALED]
+            dead_cards = [f"{card_role(card).value}(revealed)" for card in player.cards if card & CARD_REVEALED]
             
             status = "🟢 ALIVE" if player.is_alive() else "💀 DEAD"
             cards_str = f"Alive cards: [{', '.join(alive_cards)}]"
@@ -110,12 +110,12 @@ class CLIPlayer:
             print(f"  {cards_str}")
         print("================")
 
-    def choose_card_to_lose(self, cards) -> int:
+    def choose_card_to_lose(self, cards, revealed_mask: Optional[int] = None) -> int:
         """Ask player which card they want to reveal."""
         print("\nChoose a card to reveal:")
-        available_cards = [(i, card) for i, card in enumerate(cards) if not card.revealed]
+        available_cards = [(i, card) for i, card in enumerate(cards) if card < CARD_REVEALED]
         for i, card in available_cards:
-            print(f"{i}: {card.role.value}")
+            print(f"{i}: {card_role(card).value}")
         while True:
             try:
                 choice = int(input("Choose card to reveal: "))
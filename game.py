@@ -1,8 +1,12 @@
+import functools
 import random
+from types import MappingProxyType
+
+import numpy as np
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Set
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Mapping, Tuple
 
 class Role(Enum):
     ILLUSIONIST = "Illusionist"
@@ -11,19 +15,155 @@ class Role(Enum):
     POPE = "Pope"
     BLACKMAILER = "Blackmailer"
 
-class Card:
-    def __init__(self, role: Role):
-        self.role = role
-        self.revealed = False
+    def __init__(self, label: str):
+        # Dense numeric id, used as a bit position in role masks
+        self.id = len(type(self)._member_names_)
+
+ROLE_BY_ID = tuple(Role)
+ROLE_BIT = {role: 1 << role.id for role in Role}  # Role -> its bit in role masks
+
+def id_mask(members) -> int:
+    """Bitmask with bit `member.id` set for each Role/Action in `members`."""
+    mask = 0
+    for member in members:
+        mask |= 1 << member.id
+    return mask
+
+def roles_in_mask(mask: int) -> FrozenSet[Role]:
+    """Roles whose bit is set in a role id_mask."""
+    return frozenset(role for role in ROLE_BY_ID if (mask >> role.id) & 1)
+
+def next_set_bit(mask: int) -> int:
+    """Index of the lowest set bit of a non-zero mask."""
+    return (mask & -mask).bit_length() - 1
+
+# A card is a plain int: its Role.id in the low bits, OR'd with CARD_REVEALED once revealed.
+# An unrevealed card therefore compares equal to its role id.
+CARD_ROLE_MASK = 0b111
+CARD_REVEALED = 0b1000
+
+COPIES_PER_ROLE = 3  # Cards of each role in a fresh deck
+CARDS_PER_PLAYER = 2
+
+def card_role(card: int) -> Role:
+    return ROLE_BY_ID[card & CARD_ROLE_MASK]
+
+class PlayerTable:
+    """Structure-of-arrays mirror of per-player state, shared by all players of a game."""
+    def __init__(self, num_players: int):
+        self.coins = np.full(num_players, 2, dtype=np.int32)
+        self.alive_mask = np.zeros(num_players, dtype=np.uint8)
+        self.role_bits = np.zeros(num_players, dtype=np.uint16)  # bit r: owns unrevealed role r
+        self.role_counts = np.zeros((num_players, len(Role)), dtype=np.uint8)  # unrevealed copies per role
+        self.alive_bits = 0  # alive_mask packed into an int, bit i set iff player i is alive
+        self._richest = None  # Two richest alive players, None when coins/alive changed
+
+    def invalidate(self) -> None:
+        self._richest = None
+
+    def copy(self) -> "PlayerTable":
+        new = PlayerTable.__new__(PlayerTable)
+        new.coins = self.coins.copy()
+        new.alive_mask = self.alive_mask.copy()
+        new.role_bits = self.role_bits.copy()
+        new.role_counts = self.role_counts.copy()
+        new.alive_bits = self.alive_bits
+        new._richest = self._richest
+        return new
+
+    def richest_alive_opponent(self, player_id: int) -> Optional[int]:
+        """Alive player other than player_id with the most coins (lowest id on ties)."""
+        if self._richest is None:
+            # Coins change most turns, so this rebuild is the common path; a plain scan beats numpy at N <= 6
+            first = second = None
+            first_coins = second_coins = -1
+            alive = self.alive_bits
+            for i, coins in enumerate(self.coins.tolist()):
+                if (alive >> i) & 1:
+                    if coins > first_coins:
+                        second, second_coins = first, first_coins
+                        first, first_coins = i, coins
+                    elif coins > second_coins:
+                        second, second_coins = i, coins
+            self._richest = (first, second)
+        first, second = self._richest
+        return second if first == player_id else first
 
 class Player:
-    def __init__(self, name: str):
+    __slots__ = ('name', 'player_id', 'table', '_coins', 'cards', 'revealed_mask')
+
+    def __init__(self, name: str, player_id: int = 0, table: Optional[PlayerTable] = None):
         self.name = name
-        self.coins = 2
-        self.cards = []
+        self.player_id = player_id
+        self.table = table if table is not None else PlayerTable(player_id + 1)
+        self._coins = int(self.table.coins[player_id])  # Authoritative; table.coins mirrors it
+        self.cards: List[int] = []
+        self.revealed_mask = 0  # bit i set iff cards[i] is revealed
+
+    def copy(self, table: PlayerTable) -> "Player":
+        """Copy of this player whose columns live in `table`, a copy of self.table."""
+        new = Player.__new__(Player)
+        new.name = self.name
+        new.player_id = self.player_id
+        new.table = table
+        new._coins = self._coins
+        new.cards = self.cards[:]
+        new.revealed_mask = self.revealed_mask
+        return new
+
+    @property
+    def coins(self) -> int:
+        return self._coins
+
+    @coins.setter
+    def coins(self, value: int) -> None:
+        self._coins = value
+        self.table.coins[self.player_id] = value
+        self.table.invalidate()
+
+    @property
+    def role_bits(self) -> int:
+        return int(self.table.role_bits[self.player_id])
+
+    def lose_card(self, card_index: int) -> None:
+        """Reveal a card and update the role/alive columns."""
+        card = self.cards[card_index]
+        if card & CARD_REVEALED:
+            return
+        self.cards[card_index] = card | CARD_REVEALED
+        self.revealed_mask |= 1 << card_index
+        table, pid, role_id = self.table, self.player_id, card & CARD_ROLE_MASK
+        table.role_counts[pid, role_id] -= 1
+        if table.role_counts[pid, role_id] == 0:
+            table.role_bits[pid] &= ~np.uint16(1 << role_id)
+            if table.role_bits[pid] == 0:
+                table.alive_mask[pid] = 0
+                table.alive_bits &= ~(1 << pid)
+            table.invalidate()
+
+    def sync_cards(self) -> None:
+        """Recompute the role/alive columns after the card list changed."""
+        counts = self.table.role_counts[self.player_id]
+        counts[:] = 0
+        bits = 0
+        revealed_mask = 0
+        for i, card in enumerate(self.cards):
+            if card & CARD_REVEALED:
+                revealed_mask |= 1 << i
+            else:
+                counts[card] += 1
+                bits |= 1 << card
+        self.revealed_mask = revealed_mask
+        self.table.role_bits[self.player_id] = bits
+        self.table.alive_mask[self.player_id] = bits != 0
+        if bits:
+            self.table.alive_bits |= 1 << self.player_id
+        else:
+            self.table.alive_bits &= ~(1 << self.player_id)
+        self.table.invalidate()
         
     def is_alive(self) -> bool:
-        return any(not card.revealed for card in self.cards)
+        return bool((self.table.alive_bits >> self.player_id) & 1)
 
 class Action(Enum):
     INCOME = "Income"           # Take 1 coin
@@ -35,7 +175,65 @@ class Action(Enum):
     POPE = "Pope"     # Take 1 coin from each player who does not have the Pope
     BLACKMAILER = "Blackmailer"       # Take 3 coins from a player, or kill one role and pay 3, the other player decides
 
-@dataclass
+    def __init__(self, label: str):
+        # Dense numeric id, used as a bit position in action masks
+        self.id = len(type(self)._member_names_)
+
+    def __index__(self) -> int:
+        return self.id
+
+ACTION_BY_ID = tuple(Action)
+
+ACTIONS_NEEDING_TARGET = id_mask((Action.BLACKMAILER, Action.COUP))
+ACTIONS_NEEDING_CLAIM = id_mask((Action.ILLUSIONIST, Action.SPY, Action.POPE, Action.BLACKMAILER))
+
+# Valid actions by coin bucket (<3, 3-6, 7-9, 10+), in display order
+VALID_ACTIONS_BY_BUCKET = (
+    (Action.INCOME, Action.FOREIGN_AID, Action.ILLUSIONIST, Action.SPY, Action.POPE),
+    (Action.INCOME, Action.FOREIGN_AID, Action.BLACKMAILER, Action.ILLUSIONIST, Action.SPY, Action.POPE),
+    (Action.INCOME, Action.FOREIGN_AID, Action.COUP, Action.BLACKMAILER, Action.ILLUSIONIST, Action.SPY, Action.POPE),
+    (Action.COUP,),  # Coup is mandatory at 10 or more coins
+)
+VALID_ACTION_MASK_BY_BUCKET = tuple(id_mask(actions) for actions in VALID_ACTIONS_BY_BUCKET)
+
+def coin_bucket(coins: int) -> int:
+    if coins >= 10:
+        return 3
+    if coins >= 7:
+        return 2
+    if coins >= 3:
+        return 1
+    return 0
+
+# The same tables indexed directly by min(coins, MAX_COIN_KEY), so lookups skip coin_bucket
+MAX_COIN_KEY = 10
+VALID_ACTIONS_BY_COINS = tuple(VALID_ACTIONS_BY_BUCKET[coin_bucket(c)] for c in range(MAX_COIN_KEY + 1))
+VALID_ACTION_MASK_BY_COINS = tuple(VALID_ACTION_MASK_BY_BUCKET[coin_bucket(c)] for c in range(MAX_COIN_KEY + 1))
+
+# Roles that may counter each counterable action (read-only, shared by all games)
+COUNTERS_BY_ACTION = MappingProxyType({
+    Action.FOREIGN_AID: (Role.ILLUSIONIST,),
+    Action.BLACKMAILER: (Role.UNDERTAKER,),
+    Action.POPE: (Role.POPE,),
+    Action.ILLUSIONIST: (Role.ILLUSIONIST,),
+})
+# id_mask of the roles that may counter each action, indexed by Action.id (0 if none)
+COUNTER_ROLE_MASKS = tuple(id_mask(COUNTERS_BY_ACTION.get(action, ())) for action in Action)
+COUNTER_ROLES_BY_ID = tuple(COUNTERS_BY_ACTION.get(action, ()) for action in Action)  # COUNTERS_BY_ACTION by Action.id
+ACTIONS_BLOCKED_BY_COUNTER = id_mask((Action.FOREIGN_AID, Action.BLACKMAILER))  # Any successful counter blocks these
+
+# Bound once so engine hot paths compare ints instead of looking up enum members
+_ILLUSIONIST_BIT = ROLE_BIT[Role.ILLUSIONIST]
+_UNDERTAKER_BIT = ROLE_BIT[Role.UNDERTAKER]
+
+# Role claimed by each action, indexed by Action.id (-1 if none)
+ACTION_ROLE_ID = np.full(len(Action), -1, dtype=np.int8)
+ACTION_ROLE_ID[Action.ILLUSIONIST.id] = Role.ILLUSIONIST.id
+ACTION_ROLE_ID[Action.SPY.id] = Role.SPY.id
+ACTION_ROLE_ID[Action.POPE.id] = Role.POPE.id
+ACTION_ROLE_ID[Action.BLACKMAILER.id] = Role.BLACKMAILER.id
+
+@dataclass(slots=True)
 class RoleClaim:
     player_id: int
     role: Role
@@ -43,32 +241,103 @@ class RoleClaim:
     target_id: Optional[int] = None
     challenged_by: Optional[int] = None
     was_successful: bool = False
+    role_bit: int = field(init=False)  # ROLE_BIT[role]
 
-@dataclass
+    def __post_init__(self):
+        self.role_bit = ROLE_BIT[self.role]
+
+    def reset(self, player_id: int, role: Role, is_counter: bool, target_id: Optional[int] = None) -> "RoleClaim":
+        """Reuse this claim as if freshly constructed with these arguments."""
+        self.player_id = player_id
+        self.role = role
+        self.is_counter = is_counter
+        self.target_id = target_id
+        self.challenged_by = None
+        self.was_successful = False
+        self.role_bit = ROLE_BIT[role]
+        return self
+
+@dataclass(slots=True)
 class ActionResolution:
     action: Action
     actor_id: int
     target_id: Optional[int]
-    role_claims: List[RoleClaim] = None
+    role_claims: List[RoleClaim] = field(default_factory=list)
     successful: bool = False
-
-    def __post_init__(self):
-        self.role_claims = self.role_claims or []
-
-@dataclass
+    counter_role_mask: int = 0  # id_mask of the roles that may counter, set in the counter phase
+    # Set by _resolve_claims: bit player_id / bit Role.id for every successful counter
+    successful_counter_players: int = 0
+    successful_counter_roles: int = 0
+
+    def reset(self, action: Action, actor_id: int, target_id: Optional[int]) -> "ActionResolution":
+        """Reuse this resolution for a new action; role_claims keeps its list object."""
+        self.action = action
+        self.actor_id = actor_id
+        self.target_id = target_id
+        self.role_claims.clear()
+        self.successful = False
+        self.counter_role_mask = 0
+        self.successful_counter_players = 0
+        self.successful_counter_roles = 0
+        return self
+
+@dataclass(slots=True)
 class GameState:
     """Represents the current state of the game."""
     players: List[Player]
     current_player_idx: int
     deck_size: int
-    counters: Dict[Action, List[Role]]
-    known_dead_cards: Set[Role]
+    counters: Mapping[Action, Tuple[Role, ...]]
+    known_dead_mask: int    # id_mask of roles known to be dead
+    coins: np.ndarray       # int32[N]
+    alive_mask: np.ndarray  # uint8[N]
+    role_bits: np.ndarray   # uint16[N]
+    table: PlayerTable
     last_action: Optional[Action] = None
     last_actor_id: int = -1
     last_target_id: Optional[int] = None
     turn_count: int = 0
 
+    @property
+    def known_dead_cards(self) -> FrozenSet[Role]:
+        return roles_in_mask(self.known_dead_mask)
+
+    @property
+    def alive_bits(self) -> int:
+        """Bit i set iff player i is alive."""
+        return self.table.alive_bits
+
+    def richest_alive_opponent(self, player_id: int) -> Optional[int]:
+        return self.table.richest_alive_opponent(player_id)
+
+SEAT_BITS = 3  # Seats are packed below the alive bits in next-seat table keys; fits up to 8 players
+
+@functools.lru_cache(maxsize=None)
+def next_seat_table(num_players: int) -> Tuple[int, ...]:
+    """Successor seat for every (alive, idx), indexed by (alive << SEAT_BITS) | idx.
+
+    Each entry is the first seat after idx (wrapping around) whose bit is
+    set in `alive`, or idx itself if no other seat is alive.
+    """
+    table = []
+    for key in range(1 << (num_players + SEAT_BITS)):
+        idx = key & ((1 << SEAT_BITS) - 1)
+        alive = key >> SEAT_BITS
+        seat = idx
+        if idx < num_players:
+            for step in range(1, num_players):
+                candidate = (idx + step) % num_players
+                if (alive >> candidate) & 1:
+                    seat = candidate
+                    break
+        table.append(seat)
+    return tuple(table)
+
 class Game:
+    __slots__ = ('player_interfaces', 'table', 'players', 'deck_counts', 'deck_size', 'current_player_idx', 'known_dead_mask',
+                 'turn_count', 'last_action', 'last_actor_id', 'last_target_id', '_next_seat', '_state', '_challengers',
+                 '_resolution', '_claim_pool', '_claims_used')
+
     def __init__(self, num_players: int, players=None):
         if not 3 <= num_players <= 6:
             raise ValueError("Number of players must be between 3 and 6")
@@ -78,59 +347,132 @@ class Game:
             from cli_player import CLIPlayer
             players = [CLIPlayer(i) for i in range(num_players)]
         self.player_interfaces = players
+        self._challengers = self._challenger_bits(players)
         
         # Store player game states
-        self.players = [Player(f"Player_{i}") for i in range(num_players)]
-        self.deck = self._initialize_deck()
+        self.table = PlayerTable(num_players)
+        self.players = [Player(f"Player_{i}", i, self.table) for i in range(num_players)]
+        # The deck is a multiset: cards left per Role.id, drawn uniformly by _draw_random
+        self.deck_counts = self._initialize_deck()
+        self.deck_size = sum(self.deck_counts)
         self.current_player_idx = 0
-        self.counters = {
-            Action.FOREIGN_AID: [Role.ILLUSIONIST],
-            Action.BLACKMAILER: [Role.UNDERTAKER],
-            Action.POPE: [Role.POPE],
-            Action.ILLUSIONIST: [Role.ILLUSIONIST]
-        }
-        self.known_dead_cards = set()
+        self._next_seat = next_seat_table(num_players)  # Successor seat per (alive bits, seat)
+        self.known_dead_mask = 0  # id_mask of roles revealed by players who then died
         self.turn_count = 0
         self.last_action = None
         self.last_actor_id = -1
         self.last_target_id = None
+        self._state = None  # GameState snapshot shared by every interface call until game fields change
+        self._init_pools()
     
-    def _initialize_deck(self) -> List[Card]:
-        deck = []
-        for role in Role:
-            deck.extend([Card(role) for _ in range(3)])
-        random.shuffle(deck)
-        return deck
+    def clone(self, players) -> "Game":
+        """Independent copy of the game for rollouts and search, driven by `players`.
+
+        Hands, deck counts, the player table and turn bookkeeping are
+        copied (a few small arrays and lists, no deep copy). Interfaces
+        are stateful (AIPlayer history, strategy rngs), so playing the clone
+        with the live ones corrupts the real game's players; pass
+        [p.copy() for p in game.player_interfaces] for rollouts, and
+        game.player_interfaces only to share them knowingly.
+        """
+        new = Game.__new__(Game)
+        new.player_interfaces = players
+        new._challengers = self._challenger_bits(players)
+        new.table = table = self.table.copy()
+        new.players = [player.copy(table) for player in self.players]
+        new.deck_counts = self.deck_counts[:]
+        new.deck_size = self.deck_size
+        new.current_player_idx = self.current_player_idx
+        new.known_dead_mask = self.known_dead_mask
+        new.turn_count = self.turn_count
+        new.last_action = self.last_action
+        new.last_actor_id = self.last_actor_id
+        new.last_target_id = self.last_target_id
+        new._next_seat = self._next_seat
+        new._state = None
+        new._init_pools()
+        return new
+
+    def _init_pools(self) -> None:
+        # One ActionResolution and a growing list of RoleClaims, recycled every turn.
+        # Interfaces must not keep references to them past the call they are passed to.
+        self._resolution = ActionResolution(Action.INCOME, -1, None)
+        self._claim_pool = []
+        self._claims_used = 0
+
+    def _new_claim(self, player_id: int, role: Role, is_counter: bool, target_id: Optional[int] = None) -> RoleClaim:
+        """A RoleClaim from the pool, valid until the next perform_action."""
+        pool = self._claim_pool
+        n = self._claims_used
+        self._claims_used = n + 1
+        if n < len(pool):
+            return pool[n].reset(player_id, role, is_counter, target_id)
+        claim = RoleClaim(player_id, role, is_counter, target_id)
+        pool.append(claim)
+        return claim
+
+    @property
+    def known_dead_cards(self) -> FrozenSet[Role]:
+        return roles_in_mask(self.known_dead_mask)
+
+    def refresh_challengers(self) -> None:
+        """Re-read every interface's `never_challenges`, e.g. after swapping an AIPlayer's strategy."""
+        self._challengers = self._challenger_bits(self.player_interfaces)
+
+    @staticmethod
+    def _challenger_bits(interfaces) -> int:
+        """Bit i set unless interfaces[i] declares `never_challenges`; unset seats are never polled.
+
+        Computed once, when the Game is built or cloned with new interfaces;
+        see refresh_challengers().
+        """
+        bits = 0
+        for i, interface in enumerate(interfaces):
+            if not getattr(interface, 'never_challenges', False):
+                bits |= 1 << i
+        return bits
+
+    def _initialize_deck(self) -> List[int]:
+        return [COPIES_PER_ROLE] * len(Role)
     
+    def _draw_random(self) -> int:
+        """Draw a uniformly random card from the deck."""
+        counts = self.deck_counts
+        r = random.randrange(self.deck_size)
+        self.deck_size -= 1
+        self._state = None
+        for role_id, count in enumerate(counts):
+            if r < count:
+                counts[role_id] = count - 1
+                return role_id
+            r -= count
+
+    def _return_to_deck(self, card: int) -> None:
+        """Put a card's role back into the deck (the deck holds unrevealed cards only)."""
+        self.deck_counts[card & CARD_ROLE_MASK] += 1
+        self.deck_size += 1
+        self._state = None
+
     def deal_cards(self):
-        for player in self.players:
-            player.cards = [self.deck.pop() for _ in range(2)]
+        counts = self.deck_counts
+        pool = [role_id for role_id, count in enumerate(counts) for _ in range(count)]
+        # One uniform sample without replacement covers every hand
+        dealt = random.sample(pool, len(self.players) * CARDS_PER_PLAYER)
+        for role_id in dealt:
+            counts[role_id] -= 1
+        self.deck_size -= len(dealt)
+        self._state = None
+        for i, player in enumerate(self.players):
+            player.cards = dealt[i * CARDS_PER_PLAYER:(i + 1) * CARDS_PER_PLAYER]
+            player.sync_cards()
     
-    def get_valid_actions(self) -> List[Action]:
-        """Returns list of valid actions for current player."""
-        current_player = self.players[self.current_player_idx]
-        valid_actions = [Action.INCOME, Action.FOREIGN_AID]
-        
-        # Coup is mandatory if player has 10 or more coins
-        if current_player.coins >= 10:
-            return [Action.COUP]
-        
-        # Add Coup if player has enough coins
-        if current_player.coins >= 7:
-            valid_actions.append(Action.COUP)
-            
-        # Add other actions based on coins
-        if current_player.coins >= 3:
-            valid_actions.append(Action.BLACKMAILER)
-            
-        # Add actions that don't require coins
-        valid_actions.extend([
-            Action.ILLUSIONIST,
-            Action.SPY,
-            Action.POPE
-        ])
-        
-        return valid_actions
+    def get_valid_actions(self) -> Tuple[Action, ...]:
+        """Returns the valid actions for current player (a shared tuple, do not mutate)."""
+        return VALID_ACTIONS_BY_COINS[min(self.players[self.current_player_idx].coins, MAX_COIN_KEY)]
+
+    def get_valid_action_mask(self) -> int:
+        """Returns get_valid_actions() as a bitmask over Action.id."""
+        return VALID_ACTION_MASK_BY_COINS[min(self.players[self.current_player_idx].coins, MAX_COIN_KEY)]
 
     def perform_action(self, action: Action, target_id: Optional[int] = None, claimed_role: Optional[Role] = None) -> bool:
         """Initiates an action and handles challenges/counters."""
@@ -138,34 +480,31 @@ class Game:
             return False
             
         # Update game state tracking
+        idx = self.current_player_idx
         self.last_action = action
-        self.last_actor_id = self.current_player_idx
+        self.last_actor_id = idx
         self.last_target_id = target_id
         self.turn_count += 1
+        self._state = None
+        self._claims_used = 0  # Release last turn's claims
+
+        # Income and Coup have no claim or counter, so they skip resolution entirely
+        quick = self._QUICK_HANDLERS[action.id]
+        if quick is not None:
+            quick(self, idx, target_id)
+            self._next_turn()
+            return True
 
-        resolution = ActionResolution(
-            action=action,
-            actor_id=self.current_player_idx,
-            target_id=target_id
-        )
+        resolution = self._resolution.reset(action, idx, target_id)
 
         # Add initial role claim if action requires a role
         if self._requires_role(action):
             if claimed_role is None:
                 return False
-            resolution.role_claims.append(RoleClaim(
-                player_id=self.current_player_idx,
-                role=claimed_role,
-                is_counter=False,
-                target_id=target_id
-            ))
+            resolution.role_claims.append(self._new_claim(idx, claimed_role, False, target_id))
 
-        # Handle counter phase
-        if self._can_be_countered(action):
-            self._handle_counters(resolution)
-
-        # Handle challenge phase for all role claims
-        self._handle_all_challenges(resolution)
+        # Handle counter and challenge phases for all role claims
+        self._handle_counters_and_challenges(resolution)
 
         # Resolve all claims and execute action
         self._resolve_claims(resolution)
@@ -178,50 +517,72 @@ class Game:
 
     def _requires_role(self, action: Action) -> bool:
         """Check if action requires a specific role."""
-        return action in [Action.ILLUSIONIST, Action.SPY, Action.POPE, Action.BLACKMAILER]
-
-    def _can_be_countered(self, action: Action) -> bool:
-        """Check if action can be countered."""
-        return action in self.counters
+        return (ACTIONS_NEEDING_CLAIM >> action.id) & 1 != 0
+
+    def _handle_counters_and_challenges(self, resolution: ActionResolution) -> None:
+        """Handle the counter and challenge phases in one pass over the alive players.
+
+        Each alive opponent of the actor is asked whether they challenge the
+        initial claim and, if the action can be countered, whether they
+        counter it. A new counter claim is put to challenge straight away.
+        Nobody is eliminated before _resolve_claims, so the alive set is
+        fixed here.
+        """
+        alive = self.table.alive_bits
+        initial_claim = resolution.role_claims[0] if resolution.role_claims else None
+        action_id = resolution.action.id
+        resolution.counter_role_mask = counter_mask = COUNTER_ROLE_MASKS[action_id]
+        counterable = counter_mask != 0
+        possible_counter_roles = COUNTER_ROLES_BY_ID[action_id] if counterable else None
 
-    def _handle_counters(self, resolution: ActionResolution) -> None:
-        """Handle countering phase for an action."""
-        possible_counter_roles = self.counters.get(resolution.action, [])
-        
         # Special case for Blackmailer: only target can counter
-        if resolution.action == Action.BLACKMAILER:
+        if counterable and resolution.action == Action.BLACKMAILER:
+            if initial_claim is not None:
+                self._handle_challenges(initial_claim, alive)
             if resolution.target_id is not None:
-                counter_role = self._player_counters(resolution.target_id, resolution, possible_counter_roles)
-                if counter_role:
-                    resolution.role_claims.append(RoleClaim(
-                        player_id=resolution.target_id,
-                        role=counter_role,
-                        is_counter=True
-                    ))
+                self._handle_counter(resolution.target_id, resolution, possible_counter_roles, alive)
             return
 
-        # Normal counter handling for other actions
-        for i, player in enumerate(self.players):
-            if i != resolution.actor_id and player.is_alive():
-                counter_role = self._player_counters(i, resolution, possible_counter_roles)
-                if counter_role:
-                    resolution.role_claims.append(RoleClaim(
-                        player_id=i,
-                        role=counter_role,
-                        is_counter=True
-                    ))
-
-    def _handle_all_challenges(self, resolution: ActionResolution) -> None:
-        """Handle challenges for all role claims."""
-        for claim in resolution.role_claims:
-            for i, player in enumerate(self.players):
-                if i != claim.player_id and player.is_alive():
-                    if self._player_challenges(i, claim):
-                        claim.challenged_by = i
-                        break
+        for i in self._alive_indices(alive, resolution.actor_id):
+            if initial_claim is not None and initial_claim.challenged_by is None:
+                if (self._challengers >> i) & 1 and self._player_challenges(i, initial_claim):
+                    initial_claim.challenged_by = i
+            elif not counterable:
+                break  # Nothing left to ask
+            if counterable:
+                self._handle_counter(i, resolution, possible_counter_roles, alive)
+
+    def _handle_counter(self, player_id: int, resolution: ActionResolution,
+                        possible_counter_roles, alive: int) -> None:
+        """Ask one player to counter, and open any counter claim to challenges."""
+        counter_role = self._player_counters(player_id, resolution, possible_counter_roles)
+        if counter_role:
+            claim = self._new_claim(player_id, counter_role, True)
+            resolution.role_claims.append(claim)
+            self._handle_challenges(claim, alive)
+
+    def _handle_challenges(self, claim: RoleClaim, alive: int) -> None:
+        """Record the first alive player (in seat order) who challenges the claim."""
+        claim.challenged_by = next((i for i in self._alive_indices(alive & self._challengers, claim.player_id)
+                                    if self._player_challenges(i, claim)), None)
+
+    @staticmethod
+    def _alive_indices(alive: int, exclude_id: int):
+        """Seats set in the alive bits `alive`, other than exclude_id, in seat order."""
+        others = alive & ~(1 << exclude_id)
+        while others:
+            low = others & -others
+            yield low.bit_length() - 1
+            others ^= low
 
     def _resolve_claims(self, resolution: ActionResolution) -> None:
         """Resolve all claims and their challenges."""
+        # Tracked in the same pass: outcome of the initial (non-counter) claim, if any,
+        # and who successfully countered with which role
+        initial_successful = None
+        counter_players = 0
+        counter_roles = 0
+        action = resolution.action
         for claim in resolution.role_claims:
             if claim.challenged_by is not None:
                 # Handle challenge
@@ -239,102 +600,106 @@ class Game:
                 # No challenge, claim succeeds
                 claim.was_successful = True
 
-        if resolution.action in [Action.FOREIGN_AID, Action.BLACKMAILER]:
-            # These actions are COMPLETELY BLOCKED by any successful counter
-            successful_counter = any(claim.is_counter and claim.was_successful 
-                                for claim in resolution.role_claims)
-            if successful_counter:
-                resolution.successful = False
-            else:
-                # Check if initial claim was successful (if any)
-                initial_claim = next((claim for claim in resolution.role_claims 
-                                    if not claim.is_counter), None)
-                if initial_claim:
-                    resolution.successful = initial_claim.was_successful
-                else:
-                    resolution.successful = True
+            if claim.is_counter:
+                if claim.was_successful:
+                    counter_players |= 1 << claim.player_id
+                    counter_roles |= claim.role_bit
+            elif initial_successful is None:
+                initial_successful = claim.was_successful
 
+        resolution.successful_counter_players = counter_players
+        resolution.successful_counter_roles = counter_roles
+        if counter_players and (ACTIONS_BLOCKED_BY_COUNTER >> action.id) & 1:
+            # These actions are COMPLETELY BLOCKED by any successful counter
+            resolution.successful = False
         else:
-            # Otherwise, action succeeds if initial claim was successful
-            initial_claim = next((claim for claim in resolution.role_claims 
-                                if not claim.is_counter), None)
-            if initial_claim:
-                resolution.successful = initial_claim.was_successful
-            else:
-                resolution.successful = True
+            # Otherwise, action succeeds if initial claim was successful (or there was none)
+            resolution.successful = initial_successful is not False
 
-    def _execute_action(self, resolution: ActionResolution) -> None:
-        """Execute the action based on successful claims."""
-        current_player = self.players[resolution.actor_id]
+    def _do_income(self, actor_id: int, target_id: Optional[int]) -> None:
+        self.players[actor_id].coins += 1
 
-        if resolution.action == Action.INCOME:
-            current_player.coins += 1
+    def _do_coup(self, actor_id: int, target_id: Optional[int]) -> None:
+        current_player = self.players[actor_id]
+        if target_id is None or current_player.coins < 7:
+            return
+        current_player.coins -= 7
+        # Let target choose which card to reveal
+        self._eliminate_card(target_id)
 
-        elif resolution.action == Action.COUP:
-            if resolution.target_id is None or current_player.coins < 7:
-                return
-            current_player.coins -= 7
-            # Let target choose which card to reveal
-            self._eliminate_card(resolution.target_id)
+    # Handlers for actions that need no ActionResolution, indexed by Action.id
+    _QUICK_HANDLERS = [None] * len(Action)
+    _QUICK_HANDLERS[Action.INCOME.id] = _do_income
+    _QUICK_HANDLERS[Action.COUP.id] = _do_coup
+    _QUICK_HANDLERS = tuple(_QUICK_HANDLERS)
 
-        elif resolution.action == Action.FOREIGN_AID:
+    def _execute_action(self, resolution: ActionResolution) -> None:
+        """Execute the action based on successful claims."""
+        action = resolution.action
+        actor_id = resolution.actor_id
+        target_id = resolution.target_id
+        claims = resolution.role_claims
+        players = self.players
+        current_player = players[actor_id]
+
+        if action == Action.FOREIGN_AID:
             # Check if any successful counters from illusionists
-            if not any(claim.was_successful and claim.is_counter 
-                      and claim.role == Role.ILLUSIONIST 
-                      for claim in resolution.role_claims):
+            if not resolution.successful_counter_roles & _ILLUSIONIST_BIT:
                 current_player.coins += 2
 
-        elif resolution.action == Action.ILLUSIONIST:
-            # First check if action was successfully countered
-            successful_counters = [claim for claim in resolution.role_claims 
-                                if claim.is_counter and claim.was_successful]
+        elif action == Action.ILLUSIONIST:
+            # Successful counters were recorded by _resolve_claims; one pass over the claims
+            # finds the other players' Illusionist claims and the total Illusionist count
+            counter_bits = resolution.successful_counter_players
+            other_illusionists = []
+            num_illusionists = 0  # Successful Illusionist claims, counters included
+            for claim in claims:
+                if claim.was_successful and claim.role_bit == _ILLUSIONIST_BIT:
+                    num_illusionists += 1
+                    if not claim.is_counter and claim.player_id != actor_id:
+                        other_illusionists.append(claim.player_id)
             
             # Take 4 coins initially
             current_player.coins += 4
             
-            # Get all successful illusionist claims (including counters)
-            successful_illusionists = [claim.player_id for claim in resolution.role_claims 
-                                     if claim.was_successful and claim.role == Role.ILLUSIONIST]
-            
-            # For each successful counter, give them 1 coin from the acting player
-            for counter in successful_counters:
-                if current_player.coins > 0:  # Check if actor still has coins
-                    current_player.coins -= 1
-                    self.players[counter.player_id].coins += 1
+            # For each successful counter, in seat order (the order counters are claimed),
+            # give them 1 coin from the acting player
+            remaining = counter_bits
+            while remaining and current_player.coins > 0:  # Check if actor still has coins
+                low = remaining & -remaining
+                current_player.coins -= 1
+                players[low.bit_length() - 1].coins += 1
+                remaining ^= low
             
             # If there are 4 or fewer total illusionists (after counters), 
             # remaining coins are distributed to non-countering illusionists
-            remaining_illusionists = [pid for pid in successful_illusionists 
-                                    if pid != resolution.actor_id and
-                                    pid not in [c.player_id for c in successful_counters]]
-            
-            if remaining_illusionists and len(successful_illusionists) <= 4:
-                for player_id in remaining_illusionists:
+            if num_illusionists <= 4:
+                for player_id in other_illusionists:
+                    if counter_bits >> player_id & 1:
+                        continue
                     if current_player.coins > 0:  # Check if actor still has coins
                         current_player.coins -= 1
-                        self.players[player_id].coins += 1
+                        players[player_id].coins += 1
 
-        elif resolution.action == Action.BLACKMAILER:
-            if resolution.target_id is None or current_player.coins < 3:
+        elif action == Action.BLACKMAILER:
+            if target_id is None or current_player.coins < 3:
                 return
             
             # Check if action was successfully countered
-            if any(claim.was_successful and claim.is_counter 
-                   and claim.role == Role.UNDERTAKER 
-                   for claim in resolution.role_claims):
+            if resolution.successful_counter_roles & _UNDERTAKER_BIT:
                 return  # Action is blocked by successful Undertaker counter
             
-            target_player = self.players[resolution.target_id]
+            target_player = players[target_id]
             
             # If target has less than 3 coins, they must lose a card
             if target_player.coins < 3:
                 current_player.coins -= 3
                 target_player.coins += 3
                 # Let target choose which card to reveal
-                self._eliminate_card(resolution.target_id)
+                self._eliminate_card(target_id)
             else:
                 # Target can choose to pay or lose a card
-                if self._player_chooses_pay_blackmail(resolution.target_id):
+                if self._player_chooses_pay_blackmail(target_id):
                     # Target pays 3 coins
                     target_player.coins -= 3
                     current_player.coins += 3
@@ -342,75 +707,73 @@ class Game:
                     # Target loses a card but gets 3 coins
                     current_player.coins -= 3
                     target_player.coins += 3
-                    self._eliminate_card(resolution.target_id)
+                    self._eliminate_card(target_id)
 
-        elif resolution.action == Action.SPY:
+        elif action == Action.SPY:
             # Draw new card
-            new_card = self.deck.pop()
+            new_card = self._draw_random()
             current_player.cards.append(new_card)
             
             # Let player choose which card to discard
-            card_index = self._player_choose_card_to_discard(resolution.actor_id)
+            card_index = self._player_choose_card_to_discard(actor_id)
             discarded_card = current_player.cards.pop(card_index)
-            self.deck.append(discarded_card)
-            random.shuffle(self.deck)
+            current_player.sync_cards()
+            self._return_to_deck(discarded_card)
             
             # Option to redo for 1 coin
-            while current_player.coins >= 1 and self._player_wants_redo_spy(resolution.actor_id):
+            while current_player.coins >= 1 and self._player_wants_redo_spy(actor_id):
                 current_player.coins -= 1
                 # Draw new card again
-                new_card = self.deck.pop()
+                new_card = self._draw_random()
                 current_player.cards.append(new_card)
                 # Choose which to discard again
-                card_index = self._player_choose_card_to_discard(resolution.actor_id)
+                card_index = self._player_choose_card_to_discard(actor_id)
                 discarded_card = current_player.cards.pop(card_index)
-                self.deck.append(discarded_card)
-                random.shuffle(self.deck)
+                current_player.sync_cards()
+                self._return_to_deck(discarded_card)
 
-        elif resolution.action == Action.POPE:
+        elif action == Action.POPE:
             # Example of partial success based on counters
-            for i, player in enumerate(self.players):
-                if i != resolution.actor_id:
-                    # Check if this player successfully countered
-                    was_countered = any(claim.player_id == i 
-                                      and claim.was_successful 
-                                      and claim.is_counter 
-                                      for claim in resolution.role_claims)
-                    if not was_countered:
+            countered_by = resolution.successful_counter_players
+            for i, player in enumerate(players):
+                if i != actor_id:
+                    # Skip players who successfully countered
+                    if not (countered_by >> i) & 1:
                         # Take coin from player
                         if player.coins > 0:
                             player.coins -= 1
-                            self.players[resolution.actor_id].coins += 1
+                            current_player.coins += 1
 
 
     def _replace_card(self, player_id: int, role: Role) -> None:
         """Replace a shown card with a new one from the deck."""
         player = self.players[player_id]
-        for i, card in enumerate(player.cards):
-            if card.role == role:
-                # Add old card to known dead cards if player is dead
-                if not player.is_alive():
-                    self.known_dead_cards.add(card.role)
-                # Replace card
-                player.cards[i] = self.deck.pop()
-                self.deck.append(card)
-                random.shuffle(self.deck)
-                break
+        cards = player.cards
+        if role.id not in cards:
+            return
+        # An unrevealed card equals its role id, so this finds the shown card directly
+        i = cards.index(role.id)
+        # Add old card to known dead cards if player is dead
+        if not (self.table.alive_bits >> player_id) & 1:
+            self.known_dead_mask |= ROLE_BIT[role]
+            self._state = None
+        # Replace card
+        cards[i] = self._draw_random()
+        player.sync_cards()
+        self._return_to_deck(role.id)
 
     def _eliminate_card(self, player_id: int) -> None:
         """Let a player choose one of their cards to reveal when losing a challenge."""
         player = self.players[player_id]
-        available_cards = [i for i, card in enumerate(player.cards) if not card.revealed]
-        if available_cards:
-            card_index = self.player_interfaces[player_id].choose_card_to_lose(player.cards)
+        table = self.table
+        if (table.alive_bits >> player_id) & 1:
+            card_index = self.player_interfaces[player_id].choose_card_to_lose(player.cards, player.revealed_mask)
             revealed_card = player.cards[card_index]
-            revealed_card.revealed = True
-            # Update known dead cards
-            if not player.is_alive():
-                self.known_dead_cards.add(revealed_card.role)
-            
+            player.lose_card(card_index)
             # Check if player is now dead (both cards revealed)
-            if not player.is_alive():
+            if not (table.alive_bits >> player_id) & 1:
+                self.known_dead_mask |= 1 << (revealed_card & CARD_ROLE_MASK)
+                self._state = None
                 self._handle_player_death(player_id)
 
     def _handle_player_death(self, dead_player_id: int) -> None:
@@ -420,39 +783,44 @@ class Game:
             return
 
         # Ask each player if they want to claim Undertaker for the coins
+        table = self.table
         undertaker_claims = []
-        for i, player in enumerate(self.players):
-            if i != dead_player_id and player.is_alive():
-                if self._player_claims_undertaker_coins(i, dead_player_id):
-                    claim = RoleClaim(
-                        player_id=i,
-                        role=Role.UNDERTAKER,
-                        is_counter=False
-                    )
-                    undertaker_claims.append(claim)
+        for i in self._alive_indices(table.alive_bits, dead_player_id):
+            if self._player_claims_undertaker_coins(i, dead_player_id):
+                claim = self._new_claim(i, Role.UNDERTAKER, False)
+                claim.was_successful = True  # Cleared if a challenge exposes the bluff
+                undertaker_claims.append(claim)
 
         # Handle challenges for undertaker claims
-        for claim in undertaker_claims[:]:  # Use slice copy to avoid modification during iteration
-            for i, player in enumerate(self.players):
-                if i != claim.player_id and player.is_alive():
-                    if self._player_challenges(i, claim):
-                        claim.challenged_by = i
-                        has_role = self._player_has_role(claim.player_id, Role.UNDERTAKER)
-                        if has_role:
-                            # Challenge failed
-                            self._eliminate_card(claim.challenged_by)
-                            self._replace_card(claim.player_id, Role.UNDERTAKER)
-                        else:
-                            # Challenge succeeded
-                            self._eliminate_card(claim.player_id)
-                            undertaker_claims.remove(claim)
+        for claim in undertaker_claims:
+            # Visit the claimant's alive opponents in seat order; challenges eliminate
+            # cards, so seats that die before being asked are dropped as we go
+            seats = table.alive_bits & self._challengers & ~(1 << claim.player_id)
+            while seats:
+                low = seats & -seats
+                i = low.bit_length() - 1
+                seats ^= low
+                if self._player_challenges(i, claim):
+                    claim.challenged_by = i
+                    has_role = self._player_has_role(claim.player_id, Role.UNDERTAKER)
+                    if has_role:
+                        # Challenge failed
+                        self._eliminate_card(claim.challenged_by)
+                        self._replace_card(claim.player_id, Role.UNDERTAKER)
+                    else:
+                        # Challenge succeeded
+                        self._eliminate_card(claim.player_id)
+                        claim.was_successful = False
+                        break  # The claim is refuted, nobody else needs asking
+                    seats &= table.alive_bits
 
         # Distribute coins among successful undertakers
-        successful_undertakers = len(undertaker_claims)
+        successful_claims = [claim for claim in undertaker_claims if claim.was_successful]
+        successful_undertakers = len(successful_claims)
         if successful_undertakers > 0:
             coins_per_undertaker = dead_player.coins // successful_undertakers
             # Distribute coins (remainder is discarded)
-            for claim in undertaker_claims:
+            for claim in successful_claims:
                 self.players[claim.player_id].coins += coins_per_undertaker
             # Remove coins from dead player
             dead_player.coins = 0
@@ -467,7 +835,7 @@ class Game:
         return self.player_interfaces[player_id].wants_to_counter(resolution, possible_roles, self.get_game_state())
 
     def _player_choose_card_to_discard(self, player_id: int) -> int:
-        alive_cards = [card for card in self.players[player_id].cards if not card.revealed]
+        alive_cards = [card for card in self.players[player_id].cards if card < CARD_REVEALED]
         return self.player_interfaces[player_id].choose_card_to_discard(alive_cards)
 
     def _player_wants_redo_spy(self, player_id: int) -> bool:
@@ -478,32 +846,39 @@ class Game:
 
     def is_game_over(self) -> bool:
         """Returns True if only one player remains alive."""
-        alive_players = sum(1 for player in self.players if player.is_alive())
-        return alive_players <= 1
+        return self.table.alive_bits.bit_count() <= 1
 
     def _next_turn(self) -> None:
-        """Advances to the next player's turn."""
-        self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
-        # Skip dead players
-        while not self.players[self.current_player_idx].is_alive():
-            self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
+        """Advances to the next alive player's turn."""
+        self.current_player_idx = self._next_seat[(self.table.alive_bits << SEAT_BITS) | self.current_player_idx]
+        self._state = None
 
     def _player_has_role(self, player_id: int, role: Role) -> bool:
         """Check if player has the claimed role in their non-revealed cards."""
-        player = self.players[player_id]
-        return any(card.role == role and not card.revealed 
-                  for card in player.cards)
+        return role.id in self.players[player_id].cards
     
     def get_game_state(self) -> GameState:
-        """Returns current game state for AI decision making."""
-        return GameState(
-            players=self.players,
-            current_player_idx=self.current_player_idx,
-            deck_size=len(self.deck),
-            counters=self.counters.copy(),
-            known_dead_cards=self.known_dead_cards.copy(),
-            last_action=getattr(self, 'last_action', None),
-            last_actor_id=getattr(self, 'last_actor_id', -1),
-            last_target_id=getattr(self, 'last_target_id', None),
-            turn_count=self.turn_count
-        )
\ No newline at end of file
+        """Returns current game state for AI decision making.
+
+        The snapshot is cached until a field it copies changes; per-player
+        columns (coins, alive_mask, role_bits) are live views of the table.
+        Treat it as read-only.
+        """
+        state = self._state
+        if state is None:
+            state = self._state = GameState(
+                players=self.players,
+                current_player_idx=self.current_player_idx,
+                deck_size=self.deck_size,
+                counters=COUNTERS_BY_ACTION,
+                known_dead_mask=self.known_dead_mask,
+                coins=self.table.coins,
+                alive_mask=self.table.alive_mask,
+                role_bits=self.table.role_bits,
+                table=self.table,
+                last_action=self.last_action,
+                last_actor_id=self.last_actor_id,
+                last_target_id=self.last_target_id,
+                turn_count=self.turn_count
+            )
+        return state
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Numba-compiled rule kernels that step a batch of games at once.
+
+Importing this module requires Numba. Game state is laid out as arrays
+with the batch as the leading axis: int32[B, N] coins, uint8[B, N]
+alive flags and int32[B] actor ids, with actions and roles given by
+their integer ids. Each kernel mirrors the matching deterministic part
+of `Game` and updates the arrays in place unless it says otherwise;
+decisions, challenges and card choices stay with the caller.
+"""
+import numpy as np
+from numba import njit, prange
+
+from game import Role, CARDS_PER_PLAYER, COPIES_PER_ROLE, VALID_ACTION_MASK_BY_BUCKET
+
+VALID_ACTION_MASKS = np.array(VALID_ACTION_MASK_BY_BUCKET, dtype=np.int64)
+BASE_DECK = np.repeat(np.arange(len(Role), dtype=np.int8), COPIES_PER_ROLE)  # Unshuffled deck as role ids
+
+def shuffled_decks(rng: np.random.Generator, num_games: int) -> np.ndarray:
+    """int8[B, deck size] decks, each independently shuffled in one vectorized call."""
+    return rng.permuted(np.broadcast_to(BASE_DECK, (num_games, BASE_DECK.shape[0])), axis=1)
+
+def deal_batch(decks: np.ndarray, num_players: int):
+    """Deal the last cards of each shuffled deck, like Game.deal_cards's uniform draws.
+
+    Returns int8[B, N, CARDS_PER_PLAYER] card role ids and the rest of
+    the decks as int8[B, remaining].
+    """
+    dealt = num_players * CARDS_PER_PLAYER
+    remaining = decks.shape[1] - dealt
+    cards = decks[:, remaining:][:, ::-1].reshape(decks.shape[0], num_players, CARDS_PER_PLAYER)
+    return np.ascontiguousarray(cards), np.ascontiguousarray(decks[:, :remaining])
+
+@njit(cache=True)
+def coin_bucket(coins):
+    """Index into VALID_ACTION_MASKS for a player holding `coins`."""
+    if coins >= 10:
+        return 3
+    if coins >= 7:
+        return 2
+    if coins >= 3:
+        return 1
+    return 0
+
+@njit(parallel=True, cache=True)
+def valid_action_masks(coins, actor_ids):
+    """Game.get_valid_action_mask() for each game, as int64[B]."""
+    masks = np.empty(coins.shape[0], dtype=np.int64)
+    for b in prange(coins.shape[0]):
+        masks[b] = VALID_ACTION_MASKS[coin_bucket(coins[b, actor_ids[b]])]
+    return masks
+
+@njit(parallel=True, cache=True)
+def apply_income(coins, actor_ids):
+    """Income: the actor takes 1 coin."""
+    for b in prange(coins.shape[0]):
+        coins[b, actor_ids[b]] += 1
+
+@njit(parallel=True, cache=True)
+def apply_foreign_aid(coins, actor_ids, blocked):
+    """Foreign Aid: the actor takes 2 coins unless blocked[b] (a successful counter)."""
+    for b in prange(coins.shape[0]):
+        if not blocked[b]:
+            coins[b, actor_ids[b]] += 2
+
+@njit(parallel=True, cache=True)
+def apply_pope(coins, actor_ids, countered_mask):
+    """Pope: the actor takes 1 coin from every other player who has one.
+
+    Players with bit i set in countered_mask[b] successfully countered and
+    keep their coin.
+    """
+    num_players = coins.shape[1]
+    for b in prange(coins.shape[0]):
+        actor_id = actor_ids[b]
+        for i in range(num_players):
+            if i != actor_id and not (countered_mask[b] >> i) & 1 and coins[b, i] > 0:
+                coins[b, i] -= 1
+                coins[b, actor_id] += 1
+
+@njit(parallel=True, cache=True)
+def next_turn(current, alive):
+    """Game._next_turn: the first alive seat after current[b], as a new int32[B].
+
+    A game with no alive player keeps its current seat.
+    """
+    num_players = alive.shape[1]
+    nxt = current.astype(np.int32)
+    for b in prange(current.shape[0]):
+        for step in range(1, num_players + 1):
+            seat = (current[b] + step) % num_players
+            if alive[b, seat]:
+                nxt[b] = seat
+                break
+    return nxt
@@ -1,3 +1,5 @@
+import logging
+
 from game import Game
 from cli_player import CLIPlayer
 from ai_player import AIPlayer
@@ -11,12 +13,15 @@ def create_players(num_players: int, num_ai_players: int):
     players = []
     for i in range(num_players):
         if i < num_ai_players:
-            players.append(AIPlayer(i, RandomHonestStrategy()))
+            players.append(AIPlayer(i, RandomHonestStrategy(), verbose=True))
         else:
             players.append(CLIPlayer(i))
     return players
 
 def main():
+    # Show AI decisions, which are logged rather than printed
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Initialize game
     while True:
         try:
@@ -57,7 +62,11 @@ def main():
         
         # Get player's action
         valid_actions = game.get_valid_actions()
-        action, target_id, claimed_role = current_player.choose_action(valid_actions, game_state)
+        if isinstance(current_player, AIPlayer):
+            action, target_id, claimed_role = current_player.choose_action(
+                valid_actions, game_state, game.get_valid_action_mask())
+        else:
+            action, target_id, claimed_role = current_player.choose_action(valid_actions, game_state)
         
         # Perform action
         success = game.perform_action(action, target_id, claimed_role)
@@ -0,0 +1,131 @@
+import random
+
+import numpy as np
+import pytest
+
+import ai_strategies
+from ai_strategies import BasicStrategy, RandomHonestStrategy
+from ai_player import AIPlayer
+from game import Game, ACTION_BY_ID, CARD_REVEALED
+
+needs_numba = pytest.mark.skipif(ai_strategies._fast is None, reason="Numba not installed")
+
+
+class FixedDraw:
+    """Stands in for a Generator whose random() always returns u."""
+    def __init__(self, u: float):
+        self.u = u
+
+    def random(self):
+        return self.u
+
+
+def random_games(seed, count):
+    """Dealt games with random coins, some cards revealed and an alive current player."""
+    rnd = random.Random(seed)
+    games = []
+    for _ in range(count):
+        random.seed(rnd.random())
+        game = Game(rnd.randint(3, 6), [])
+        game.deal_cards()
+        for player in game.players:
+            player.coins = rnd.randint(0, 12)
+            if rnd.random() < 0.3:
+                player.lose_card(0)
+            if rnd.random() < 0.15:
+                player.lose_card(1)
+        alive = [i for i, player in enumerate(game.players) if player.is_alive()]
+        if not alive:
+            continue
+        game.current_player_idx = rnd.choice(alive)
+        games.append(game)
+    return games
+
+
+@needs_numba
+def test_choose_action_basic_matches_python_strategy():
+    strategy = BasicStrategy()
+    for game in random_games(1, 300):
+        state = game.get_game_state()
+        player_id = game.current_player_idx
+        mask = game.get_valid_action_mask()
+        action_id, target_id = ai_strategies._fast.choose_action_basic(
+            state.coins, state.alive_mask, mask, player_id)
+        expected = strategy.evaluate_action(state, game.get_valid_actions(), player_id, mask)
+        assert (ACTION_BY_ID[action_id], target_id if target_id >= 0 else None, None) == expected
+
+
+@needs_numba
+def test_choose_action_honest_matches_python_path(monkeypatch):
+    rnd = random.Random(2)
+    games = random_games(2, 300)
+    draws = [rnd.random() for _ in games]
+    draws[:3] = [0.0, 1 - 2 ** -30, 1 - 2 ** -53]
+    fast = [RandomHonestStrategy(FixedDraw(u)).evaluate_action(
+        game.get_game_state(), game.get_valid_actions(), game.current_player_idx)
+        for game, u in zip(games, draws)]
+    monkeypatch.setattr(ai_strategies, "_fast", None)
+    python = [RandomHonestStrategy(FixedDraw(u)).evaluate_action(
+        game.get_game_state(), game.get_valid_actions(), game.current_player_idx)
+        for game, u in zip(games, draws)]
+    assert fast == python
+
+
+def play_out(game, max_turns):
+    """Winner of `game` played by its interfaces, or -1 after max_turns."""
+    for _ in range(max_turns):
+        if game.is_game_over():
+            break
+        interface = game.player_interfaces[game.current_player_idx]
+        game.perform_action(*interface.choose_action(
+            game.get_valid_actions(), game.get_game_state(), game.get_valid_action_mask()))
+    alive = [i for i, player in enumerate(game.players) if player.is_alive()]
+    return alive[0] if len(alive) == 1 else -1
+
+
+def rollout_inputs(game):
+    coins = np.array([player.coins for player in game.players], dtype=np.int32)
+    cards_left = np.array([sum(not card & CARD_REVEALED for card in player.cards) for player in game.players],
+                          dtype=np.uint8)
+    return coins, cards_left
+
+
+@needs_numba
+@pytest.mark.parametrize("max_turns", [5, 500])
+def test_rollout_basic_matches_engine(max_turns):
+    for game in random_games(3, 200):
+        coins, cards_left = rollout_inputs(game)
+        winner = ai_strategies._fast.rollout_basic(coins, cards_left, game.current_player_idx, max_turns)
+        players = [AIPlayer(i) for i in range(len(game.players))]
+        assert winner == play_out(game.clone(players), max_turns)
+
+
+@needs_numba
+def test_rollout_basic_batch_matches_single_rollouts():
+    games = [game for game in random_games(4, 100) if len(game.players) == 5]
+    inputs = [rollout_inputs(game) for game in games]
+    coins = np.stack([c for c, _ in inputs])
+    cards_left = np.stack([left for _, left in inputs])
+    first = np.array([game.current_player_idx for game in games], dtype=np.int32)
+    winners = ai_strategies._fast.rollout_basic_batch(coins, cards_left, first, 500)
+    expected = [ai_strategies._fast.rollout_basic(c, left, f, 500) for c, left, f in zip(coins, cards_left, first)]
+    assert winners.tolist() == expected
+    assert (coins == np.stack([c for c, _ in inputs])).all()  # Inputs are not modified
+
+
+@pytest.mark.parametrize("num_players", [4, 6])
+def test_evaluate_action_batch_matches_per_state(num_players):
+    games = [game for game in random_games(5, 400) if len(game.players) == num_players]
+    states = [game.get_game_state() for game in games]
+    coins = np.stack([state.coins for state in states])
+    alive = np.stack([state.alive_mask for state in states])
+    player_ids = np.array([game.current_player_idx for game in games], dtype=np.int32)
+    valid_mask = np.array([game.get_valid_action_mask() for game in games], dtype=np.uint32)
+
+    strategy = BasicStrategy()
+    actions, targets = strategy.evaluate_action_batch(coins, alive, player_ids, valid_mask)
+    for b, (game, state) in enumerate(zip(games, states)):
+        action, target_id, _ = strategy.evaluate_action(
+            state, game.get_valid_actions(), game.current_player_idx, int(valid_mask[b]))
+        assert ACTION_BY_ID[actions[b]] == action
+        assert (targets[b] if targets[b] >= 0 else None) == target_id
@@ -0,0 +1,103 @@
+import random
+
+from game import Game, Role, Action, CARD_REVEALED, card_role
+from ai_player import AIPlayer
+
+
+class ScriptedPlayer:
+    """Interface stub with fixed answers; loses its first unrevealed card."""
+    def __init__(self, player_id: int, claims_undertaker: bool = False, challenges: bool = False):
+        self.player_id = player_id
+        self.claims_undertaker = claims_undertaker
+        self.challenges = challenges
+        self.challenge_calls = 0
+
+    def wants_to_claim_undertaker_coins(self, available_coins, game_state):
+        return self.claims_undertaker
+
+    def wants_to_challenge(self, claim, game_state):
+        self.challenge_calls += 1
+        return self.challenges
+
+    def choose_card_to_lose(self, cards, revealed_mask=None):
+        return next(i for i, card in enumerate(cards) if not card & CARD_REVEALED)
+
+
+def make_game(hands, interfaces):
+    """Game whose hands are dealt as given; each hand is a list of card ints."""
+    game = Game(len(hands), interfaces)
+    for player, hand in zip(game.players, hands):
+        player.cards = list(hand)
+        player.sync_cards()
+        for card in hand:
+            game.deck_counts[card & ~CARD_REVEALED] -= 1
+        game.deck_size -= len(hand)
+    return game
+
+
+def test_two_challengers_against_one_bluffed_undertaker_claim():
+    interfaces = [
+        ScriptedPlayer(0),
+        ScriptedPlayer(1, claims_undertaker=True),
+        ScriptedPlayer(2, challenges=True),
+        ScriptedPlayer(3, challenges=True),
+    ]
+    game = make_game([
+        [Role.POPE.id, Role.SPY.id],
+        [Role.ILLUSIONIST.id, Role.SPY.id],  # Bluffing: no Undertaker
+        [Role.POPE.id, Role.BLACKMAILER.id],
+        [Role.ILLUSIONIST.id, Role.BLACKMAILER.id],
+    ], interfaces)
+    game.players[0].coins = 4
+
+    game._eliminate_card(0)
+    game._eliminate_card(0)
+
+    bluffer = game.players[1]
+    assert not game.players[0].is_alive()
+    assert bluffer.revealed_mask.bit_count() == 1  # Loses one card, not one per challenger
+    assert bluffer.is_alive()
+    assert bluffer.coins == 2
+    assert interfaces[2].challenge_calls == 1
+    assert interfaces[3].challenge_calls == 0  # Claim already refuted
+
+
+def test_replace_card_skips_revealed_copy_of_the_role():
+    game = make_game([
+        [Role.POPE.id | CARD_REVEALED, Role.POPE.id],
+        [Role.SPY.id, Role.SPY.id],
+        [Role.ILLUSIONIST.id, Role.BLACKMAILER.id],
+    ], [ScriptedPlayer(i) for i in range(3)])
+    deck_size = game.deck_size
+
+    game._replace_card(0, Role.POPE)
+
+    cards = game.players[0].cards
+    assert cards[0] == Role.POPE.id | CARD_REVEALED
+    assert not cards[1] & CARD_REVEALED
+    assert game.deck_size == deck_size
+    assert sum(game.deck_counts) == deck_size
+
+
+def test_clone_is_independent_of_the_original():
+    random.seed(7)
+    game = Game(4, [AIPlayer(i) for i in range(4)])
+    game.deal_cards()
+    coins = game.table.coins.copy()
+    cards = [player.cards[:] for player in game.players]
+    deck_counts = game.deck_counts[:]
+    history = [interface._ah_idx for interface in game.player_interfaces]
+
+    clone = game.clone([interface.copy() for interface in game.player_interfaces])
+    clone.players[1].coins = 9
+    clone._eliminate_card(2)
+    clone._replace_card(3, card_role(clone.players[3].cards[0]))
+    clone.perform_action(Action.INCOME)
+    clone.player_interfaces[0].choose_action(clone.get_valid_actions(), clone.get_game_state())
+
+    assert (game.table.coins == coins).all()
+    assert [player.cards for player in game.players] == cards
+    assert game.deck_counts == deck_counts
+    assert game.table.alive_bits == 0b1111
+    assert game.turn_count == 0 and game.current_player_idx == 0
+    assert [interface._ah_idx for interface in game.player_interfaces] == history
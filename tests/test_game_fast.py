@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+import game_fast
+from game import Game, Role, CARD_REVEALED
+
+
+def make_tables(rng, num_games, num_players):
+    """Random int32[B, N] coins, uint8[B, N] alive flags and int32[B] actor ids."""
+    coins = rng.integers(0, 13, size=(num_games, num_players), dtype=np.int32)
+    alive = (rng.random((num_games, num_players)) < 0.7).astype(np.uint8)
+    actors = rng.integers(0, num_players, size=num_games, dtype=np.int32)
+    return coins, alive, actors
+
+
+def game_at(coins, alive, actor):
+    """Game with the given coins, alive seats and current player."""
+    game = Game(len(coins), [])
+    for player, player_coins, is_alive in zip(game.players, coins, alive):
+        player.coins = int(player_coins)
+        card = Role.POPE.id if is_alive else Role.POPE.id | CARD_REVEALED
+        player.cards = [card, card]
+        player.sync_cards()
+    game.current_player_idx = int(actor)
+    return game
+
+
+@pytest.mark.parametrize("num_players", [3, 6])
+def test_valid_action_masks_match_game(num_players):
+    coins, alive, actors = make_tables(np.random.default_rng(num_players), 200, num_players)
+    masks = game_fast.valid_action_masks(coins, actors)
+    for b in range(len(actors)):
+        assert masks[b] == game_at(coins[b], alive[b], actors[b]).get_valid_action_mask()
+
+
+@pytest.mark.parametrize("num_players", [3, 6])
+def test_next_turn_matches_game(num_players):
+    coins, alive, actors = make_tables(np.random.default_rng(num_players), 200, num_players)
+    nxt = game_fast.next_turn(actors, alive)
+    for b in range(len(actors)):
+        game = game_at(coins[b], alive[b], actors[b])
+        game._next_turn()
+        assert nxt[b] == game.current_player_idx
+
+
+def test_deal_batch_hands_come_from_the_deck():
+    decks = game_fast.shuffled_decks(np.random.default_rng(0), 50)
+    cards, rest = game_fast.deal_batch(decks, 4)
+    for b in range(len(decks)):
+        dealt = np.concatenate([cards[b].ravel(), rest[b]])
+        assert sorted(dealt.tolist()) == sorted(game_fast.BASE_DECK.tolist())